@@ -7,6 +7,25 @@ Compatible with Python 3.11+
 import pygame  # Import pygame library for game development
 import sys  # Import sys for system operations like exit
 import random  # Import random for generating random food positions
+import functools  # Import functools for caching rendered text
+import platform  # Import platform to detect PyPy
+from array import array  # Import array for compact snake body storage under PyPy
+from pygame._sdl2.video import Window, Renderer, Texture  # SDL2 GPU rendering
+
+try:
+    from numba import njit  # JIT compiler for the per-tick snake step
+except ImportError:  # numba not installed - run the same code as plain Python
+    def njit(*args, **kwargs):
+        """Fallback decorator that returns the function unchanged."""
+        if args and callable(args[0]):  # Used as bare @njit
+            return args[0]
+        return lambda func: func  # Used as @njit(...)
+
+# numpy goes through a slow C-extension layer on PyPy, so use plain arrays there
+# and let PyPy's JIT compile the snake code instead
+IS_PYPY = platform.python_implementation() == "PyPy"
+if not IS_PYPY:
+    import numpy as np  # Import numpy for compact, vectorised snake body storage
 
 # Initialize Pygame modules (must be called before using pygame features)
 pygame.init()
@@ -18,6 +37,33 @@ GRID_SIZE = 20  # Size of each grid cell (snake moves one cell at a time)
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE  # Number of grid cells horizontally
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE  # Number of grid cells vertically
 FPS = 10  # Frames per second (controls game speed)
+SNAKE_CAPACITY = GRID_WIDTH * GRID_HEIGHT  # Max segments (the whole grid)
+
+# Snake ring buffer storage - numpy int16 arrays on CPython, array('h') on PyPy
+if IS_PYPY:
+    def new_ring_buffer():
+        """Return a zeroed int16 ring buffer for snake coordinates."""
+        return array("h", [0]) * SNAKE_CAPACITY
+    
+    def join_ring(first, second):
+        """Join the two pieces of a wrapped ring buffer slice."""
+        return first + second
+    
+    def to_pixels(values):
+        """Convert grid coordinates to a list of pixel coordinates."""
+        return [value * GRID_SIZE for value in values]
+else:
+    def new_ring_buffer():
+        """Return a zeroed int16 ring buffer for snake coordinates."""
+        return np.zeros(SNAKE_CAPACITY, dtype=np.int16)
+    
+    def join_ring(first, second):
+        """Join the two pieces of a wrapped ring buffer slice."""
+        return np.concatenate((first, second))
+    
+    def to_pixels(values):
+        """Convert grid coordinates to a list of pixel coordinates (one vectorised multiply)."""
+        return (values * GRID_SIZE).tolist()
 
 # Color definitions using RGB values
 BLACK = (0, 0, 0)  # Pure black for background
@@ -30,17 +76,161 @@ RED = (255, 0, 0)  # Red for food
 PLAYING = 1  # Game is running
 GAME_OVER = 2  # Game has ended
 
-# Initialize the display window
-screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))  # Create the game window
-pygame.display.set_caption("Snake Game")  # Set window title
+# Movement directions as (x_change, y_change) grid steps
+UP = (0, -1)  # y decreases
+DOWN = (0, 1)  # y increases
+LEFT = (-1, 0)  # x decreases
+RIGHT = (1, 0)  # x increases
+
+# Arrow key -> direction lookup (replaces an if/elif chain per key press)
+DIR_BY_KEY = {
+    pygame.K_UP: UP,
+    pygame.K_DOWN: DOWN,
+    pygame.K_LEFT: LEFT,
+    pygame.K_RIGHT: RIGHT,
+}
+
+# Initialize the display window with a GPU-accelerated SDL2 renderer
+# All drawing is done with textures, so drawing and presentation run on the GPU
+window = Window("Snake Game", size=(WINDOW_WIDTH, WINDOW_HEIGHT), resizable=True)  # Create the game window
+renderer = Renderer(window, accelerated=-1, vsync=True)  # Prefer hardware, fall back to software
+renderer.logical_size = (WINDOW_WIDTH, WINDOW_HEIGHT)  # Fixed game resolution, GPU scales it to the window (like pygame.SCALED)
+
 
-# Initialize clock to control frame rate
-clock = pygame.time.Clock()  # Clock object for FPS control
+def to_texture(surface):
+    """Upload a surface to the GPU as a texture for the game renderer."""
+    return Texture.from_surface(renderer, surface)
+
+
+# Pre-render the static background (black fill + grid lines) once at startup
+# Drawing this single texture each frame is much cheaper than ~70 line draws
+GRID_BG = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))  # Background surface
+GRID_BG.fill(BLACK)  # Black background
+for x in range(0, WINDOW_WIDTH, GRID_SIZE):  # Vertical lines
+    pygame.draw.line(GRID_BG, DARK_GRAY, (x, 0), (x, WINDOW_HEIGHT), 1)  # Thin dark gray line
+for y in range(0, WINDOW_HEIGHT, GRID_SIZE):  # Horizontal lines
+    pygame.draw.line(GRID_BG, DARK_GRAY, (0, y), (WINDOW_WIDTH, y), 1)  # Thin dark gray line
+GRID_BG = to_texture(GRID_BG)  # Upload once
+
+# Pre-render snake segments with rounded corners baked in (transparent corners)
+HEAD_SPRITE = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+pygame.draw.rect(HEAD_SPRITE, NEON_GREEN, HEAD_SPRITE.get_rect(), border_radius=5)  # Head: larger rounded corners
+HEAD_SPRITE = to_texture(HEAD_SPRITE)  # Upload once
+BODY_SPRITE = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+pygame.draw.rect(BODY_SPRITE, NEON_GREEN, BODY_SPRITE.get_rect(), border_radius=3)  # Body: standard rounded corners
+BODY_SPRITE = to_texture(BODY_SPRITE)  # Upload once
+
+# Pre-render food with rounded corners baked in
+FOOD_SPRITE = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+pygame.draw.rect(FOOD_SPRITE, RED, FOOD_SPRITE.get_rect(), border_radius=8)  # Red food with rounded corners
+FOOD_SPRITE = to_texture(FOOD_SPRITE)  # Upload once
+
+# Custom event posted by a timer once per game tick (drives movement and redraw)
+STEP_EVENT = pygame.USEREVENT + 1
 
 # Initialize font for displaying text
 font = pygame.font.Font(None, 36)  # Default font, size 36 pixels
 
 
+def build_game_over_overlay():
+    """Compose the overlay, "GAME OVER" and restart text into one uploaded texture."""
+    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)  # Per-pixel alpha
+    overlay.fill((0, 0, 0, 180))  # Semi-transparent black (alpha 0-255, lower = more transparent)
+    game_over_text = font.render("GAME OVER", True, WHITE)  # White text
+    overlay.blit(game_over_text, game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50)))  # Center horizontally, slightly above center vertically
+    restart_text = font.render("Press R to Restart | ESC to Quit", True, WHITE)  # White text
+    overlay.blit(restart_text, restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50)))  # Center horizontally, slightly below center
+    return to_texture(overlay)  # Upload once
+
+
+# Pre-compose the static game over screen (overlay + text) into one texture
+GAME_OVER_OVERLAY = build_game_over_overlay()
+
+
+@njit(cache=True)
+def step_snake(xs, ys, occ, head, tail, dx, dy, grow):
+    """Advance the snake one cell in its ring buffer.
+    
+    Moves the head index back one slot and, unless the snake is growing,
+    moves the tail index back too (releasing the old tail cell first, so the
+    head may follow straight into it). Returns (new_head, new_tail, collided).
+    """
+    capacity = len(xs)  # Ring buffer size
+    
+    # Retract tail unless growing - clear its occupancy bit and drop it from the ring
+    if not grow:
+        occ[ys[tail] * GRID_WIDTH + xs[tail]] = 0  # Old tail cell is free
+        tail = (tail - 1) % capacity
+    
+    # Write new head one slot before the current head
+    new_head = (head - 1) % capacity
+    new_x = xs[head] + dx  # Move in X direction
+    new_y = ys[head] + dy  # Move in Y direction
+    xs[new_head] = new_x
+    ys[new_head] = new_y
+    
+    # Check wall collision - head outside grid boundaries
+    collided = new_x < 0 or new_x >= GRID_WIDTH or new_y < 0 or new_y >= GRID_HEIGHT
+    
+    # Check self collision - single lookup in the occupancy bitmap
+    if not collided:
+        cell = new_y * GRID_WIDTH + new_x  # Bitmap index of the new head
+        if occ[cell]:  # Cell already covered by the body
+            collided = True  # Hit itself
+        occ[cell] = 1  # New head cell is now occupied
+    
+    return new_head, tail, collided
+
+
+# Compile step_snake now on a scratch snake, so the first game tick does not stall
+step_snake(
+    new_ring_buffer(), new_ring_buffer(),
+    bytearray(GRID_WIDTH * GRID_HEIGHT), 0, 0, 1, 0, False,
+)
+
+
+# Bound once so food placement skips the module attribute lookup
+_getrandbits = random.getrandbits
+
+
+class EmptyCells:
+    """Set of free grid cells with O(1) add, remove and random pick."""
+    
+    def __init__(self):
+        """Start with every grid cell free."""
+        # Cells stored in a list (for random picks) plus a dict of cell -> list index
+        self.cells = [(x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)]
+        self.index = {cell: i for i, cell in enumerate(self.cells)}
+    
+    def add(self, cell):
+        """Mark a cell as free (ignored if already free)."""
+        if cell not in self.index:
+            self.index[cell] = len(self.cells)  # Appended at the end
+            self.cells.append(cell)
+    
+    def discard(self, cell):
+        """Mark a cell as occupied (ignored if not free or off the grid)."""
+        i = self.index.pop(cell, None)  # Position of cell in the list
+        if i is not None:
+            last = self.cells.pop()  # Take last cell off the list
+            if i < len(self.cells):  # Removed cell was not the last one
+                self.cells[i] = last  # Move last cell into the gap
+                self.index[last] = i
+    
+    def choice(self):
+        """Return a random free cell."""
+        # Draw just enough random bits for an index and reject out-of-range values
+        # (what random.choice does internally, minus its extra Python-level calls)
+        count = len(self.cells)
+        if not count:  # Whole grid covered by the snake
+            raise IndexError("no free cells")
+        bits = count.bit_length()
+        index = _getrandbits(bits)
+        while index >= count:  # Less than half of draws are rejected
+            index = _getrandbits(bits)
+        return self.cells[index]
+
+
 class Snake:
     """Snake class that manages the snake's body and movement."""
     
@@ -50,41 +240,74 @@ class Snake:
         start_x = GRID_WIDTH // 2  # Center horizontally
         start_y = GRID_HEIGHT // 2  # Center vertically
         
-        # Snake body: list of [x, y] grid positions (not pixel positions)
-        # Head is at index 0, tail is at the end
-        self.body = [[start_x, start_y]]  # Start with just the head
+        # Snake body: ring buffer of grid positions stored as two int16 buffers
+        # Segments run from index head (the head) forward to index tail, wrapping around
+        self.xs = new_ring_buffer()  # X of each segment
+        self.ys = new_ring_buffer()  # Y of each segment
+        self.head = 0  # Ring index of the head segment
+        self.tail = 0  # Ring index of the tail segment (start with just the head)
+        self.xs[0] = start_x  # Head X
+        self.ys[0] = start_y  # Head Y
+        self.collided = False  # Set by update() when the head hits a wall or the body
         
-        # Direction: [x_change, y_change] for grid movement
-        # [1, 0] = right, [-1, 0] = left, [0, 1] = down, [0, -1] = up
-        self.direction = [1, 0]  # Start moving right
-        self.next_direction = [1, 0]  # Queued direction for next move
+        # Occupancy bitmap: occ[y * GRID_WIDTH + x] is 1 for every cell the snake covers
+        self.occ = bytearray(GRID_WIDTH * GRID_HEIGHT)
+        self.occ[start_y * GRID_WIDTH + start_x] = 1  # Head occupies the start cell
+        
+        # Free grid cells (kept in sync as the snake moves, used to place food)
+        self.empty = EmptyCells()
+        self.empty.discard((start_x, start_y))  # Head occupies the start cell
+        
+        # Direction: (x_change, y_change) tuple for grid movement (UP/DOWN/LEFT/RIGHT)
+        self.direction = RIGHT  # Start moving right
+        self.next_direction = RIGHT  # Queued direction for next move
     
-    def update(self):
-        """Update snake position - move one grid cell in current direction."""
+    def update(self, ate_food):
+        """Move one grid cell in current direction, keeping the tail if food was eaten."""
         # Update direction from queued direction (allows one queued direction)
-        self.direction = self.next_direction.copy()
-        
-        # Get current head position
-        head_x, head_y = self.body[0]
+        self.direction = self.next_direction  # Tuples are immutable - no copy needed
+        dx, dy = self.direction
+        old_tail = self.tail_position()  # Cell released unless the snake grows
         
-        # Calculate new head position by adding direction
-        new_head_x = head_x + self.direction[0]  # Move in X direction
-        new_head_y = head_y + self.direction[1]  # Move in Y direction
+        # Advance head (and tail unless growing) in the ring buffer (compiled step, no shifting)
+        self.head, self.tail, collided = step_snake(
+            self.xs, self.ys, self.occ, self.head, self.tail, dx, dy, ate_food
+        )
+        self.collided = bool(collided)  # Store result for check_collision()
         
-        # Add new head to the front of the body
-        self.body.insert(0, [new_head_x, new_head_y])
+        # Keep free cells in sync - release old tail first, the head may have moved into it
+        if not ate_food:
+            self.empty.add(old_tail)  # Tail cell is free again
+        self.empty.discard(self.head_position())  # New head cell is no longer free
+    
+    def next_head_position(self):
+        """Return the (x, y) grid position the head moves to on the next update."""
+        head_x, head_y = self.head_position()
+        dx, dy = self.next_direction
+        return head_x + dx, head_y + dy
+    
+    def head_position(self):
+        """Return the (x, y) grid position of the head."""
+        return int(self.xs[self.head]), int(self.ys[self.head])
     
-    def grow(self):
-        """Make snake grow by NOT removing the tail next update."""
-        # Snake grows by keeping the tail when moving
-        # This is handled in update() - we just don't pop the tail
-        pass
+    def tail_position(self):
+        """Return the (x, y) grid position of the tail."""
+        return int(self.xs[self.tail]), int(self.ys[self.tail])
     
-    def shrink(self):
-        """Remove tail segment (called after moving to keep length constant)."""
-        # Remove last segment (tail) if snake hasn't grown
-        if len(self.body) > 1:  # Only remove if more than head exists
-            self.body.pop()  # Remove the last element (tail)
+    def _live(self, values):
+        """Return the live segments of a ring array, head first (a view on CPython unless wrapped)."""
+        if self.head <= self.tail:  # Contiguous - plain slice
+            return values[self.head:self.tail + 1]
+        # Wrapped around the end of the buffer - join the two pieces
+        return join_ring(values[self.head:], values[:self.tail + 1])
+    
+    def body_xs(self):
+        """Return X positions of all segments, head first."""
+        return self._live(self.xs)
+    
+    def body_ys(self):
+        """Return Y positions of all segments, head first."""
+        return self._live(self.ys)
     
     def change_direction(self, new_direction):
         """Change snake direction (prevents reversing into itself)."""
@@ -92,84 +315,42 @@ class Snake:
         # Check if new direction is opposite of current direction
         if new_direction[0] != -self.direction[0] or new_direction[1] != -self.direction[1]:
             # Safe to change direction
-            self.next_direction = new_direction.copy()
+            self.next_direction = new_direction
     
     def check_collision(self):
         """Check if snake collides with walls or itself. Returns True if collision."""
-        head_x, head_y = self.body[0]  # Get head position
-        
-        # Check wall collision - head outside grid boundaries
-        if head_x < 0 or head_x >= GRID_WIDTH or head_y < 0 or head_y >= GRID_HEIGHT:
-            return True  # Hit a wall
-        
-        # Check self collision - head overlaps with any body segment
-        for segment in self.body[1:]:  # Skip head, check rest of body
-            if head_x == segment[0] and head_y == segment[1]:  # Same grid position
-                return True  # Hit itself
-        
-        return False  # No collision
-    
-    def draw(self, surface):
-        """Draw the snake on the screen using rounded rectangles."""
-        for i, segment in enumerate(self.body):  # Loop through each body segment
-            # Convert grid coordinates to pixel coordinates
-            pixel_x = segment[0] * GRID_SIZE  # Multiply by grid size
-            pixel_y = segment[1] * GRID_SIZE  # Multiply by grid size
-            
-            # Create rectangle for this segment
-            rect = pygame.Rect(pixel_x, pixel_y, GRID_SIZE, GRID_SIZE)
-            
-            # Draw rounded rectangle (head slightly brighter, body standard green)
-            # Parameters: surface, color, rect, border_radius (rounded corners)
-            if i == 0:  # Head segment
-                # Head: bright neon green, slightly larger rounded corners
-                pygame.draw.rect(surface, NEON_GREEN, rect, border_radius=5)
-            else:  # Body segments
-                # Body: same green, standard rounded corners
-                pygame.draw.rect(surface, NEON_GREEN, rect, border_radius=3)
+        # Walls and occupancy bitmap were already checked by step_snake() during update()
+        return self.collided
 
 
 class Food:
     """Food class that manages food position and appearance."""
     
-    def __init__(self, snake_body):
+    def __init__(self, empty_cells):
         """Initialize food at a random position, avoiding snake body."""
-        # Generate food position that doesn't overlap with snake
-        self.position = self.generate_position(snake_body)
-    
-    def generate_position(self, snake_body):
-        """Generate random food position that doesn't overlap with snake."""
-        while True:  # Keep trying until we find valid position
-            # Random grid coordinates within boundaries
-            x = random.randint(0, GRID_WIDTH - 1)  # Random X (0 to GRID_WIDTH-1)
-            y = random.randint(0, GRID_HEIGHT - 1)  # Random Y (0 to GRID_HEIGHT-1)
-            
-            # Check if position overlaps with snake body
-            valid = True  # Assume valid initially
-            for segment in snake_body:  # Check each snake segment
-                if x == segment[0] and y == segment[1]:  # Overlaps with snake
-                    valid = False  # Position is invalid
-                    break
-            
-            if valid:  # Found valid position
-                return [x, y]  # Return grid coordinates
-    
-    def draw(self, surface):
-        """Draw food on the screen as a rounded rectangle."""
-        # Convert grid coordinates to pixel coordinates
-        pixel_x = self.position[0] * GRID_SIZE  # Multiply by grid size
-        pixel_y = self.position[1] * GRID_SIZE  # Multiply by grid size
-        
-        # Create rectangle for food
-        rect = pygame.Rect(pixel_x, pixel_y, GRID_SIZE, GRID_SIZE)
-        
-        # Draw rounded rectangle (red food with rounded corners)
-        pygame.draw.rect(surface, RED, rect, border_radius=8)
+        # Pick straight from the free cells - never overlaps with snake
+        self.position = empty_cells.choice()
+
+
+def build_draw_list(snake, food):
+    """Return (sprite texture, pixel position) pairs for food and every snake segment."""
+    # Food first, so the snake is drawn on top of it
+    food_x, food_y = food.position
+    draw_list = [(FOOD_SPRITE, (food_x * GRID_SIZE, food_y * GRID_SIZE))]
+    
+    # Convert all snake grid coordinates to pixel coordinates
+    pixel_xs = to_pixels(snake.body_xs())
+    pixel_ys = to_pixels(snake.body_ys())
+    
+    # Head uses its own sprite, then one body sprite per remaining segment
+    draw_list.append((HEAD_SPRITE, (pixel_xs[0], pixel_ys[0])))
+    draw_list.extend((BODY_SPRITE, (x, y)) for x, y in zip(pixel_xs[1:], pixel_ys[1:]))
+    return draw_list
 
 
 def check_food_collision(snake, food):
-    """Check if snake head is on same grid cell as food. Returns True if collision."""
-    head_x, head_y = snake.body[0]  # Get snake head position
+    """Check if snake head will move onto the food cell. Returns True if collision."""
+    head_x, head_y = snake.next_head_position()  # Get where the head is about to move
     food_x, food_y = food.position  # Get food position
     
     # Check if head and food are on same grid cell
@@ -178,35 +359,33 @@ def check_food_collision(snake, food):
     return False  # No collision
 
 
+@functools.lru_cache(maxsize=512)
+def _render_score(score):
+    """Render and upload the score text (each score is rasterised once)."""
+    return to_texture(font.render(f"Score: {score}", True, WHITE))  # White text
+
+
+@functools.lru_cache(maxsize=512)
+def _render_final_score(score):
+    """Render and upload the game over "Final Score" line, returning (texture, rect)."""
+    score_text = font.render(f"Final Score: {score}", True, NEON_GREEN)  # Green text
+    score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))  # Center of screen
+    return to_texture(score_text), score_rect
+
+
 def draw_score(score):
     """Draw the score in the top-left corner of the screen."""
-    # Create text surface with score
-    score_text = font.render(f"Score: {score}", True, WHITE)  # White text
-    screen.blit(score_text, (10, 10))  # Draw at position (10, 10) from top-left
+    _render_score(score).draw(dstrect=(10, 10))  # Draw at position (10, 10) from top-left
 
 
 def draw_game_over(score):
     """Draw game over screen with score and restart instructions."""
-    # Fill screen with semi-transparent black overlay
-    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))  # Create overlay surface
-    overlay.set_alpha(180)  # Set transparency (0-255, lower = more transparent)
-    overlay.fill(BLACK)  # Fill with black
-    screen.blit(overlay, (0, 0))  # Draw overlay on screen
-    
-    # Create and draw "GAME OVER" text
-    game_over_text = font.render("GAME OVER", True, WHITE)  # White text
-    text_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))  # Center horizontally, slightly above center vertically
-    screen.blit(game_over_text, text_rect)  # Draw centered text
+    # Draw pre-composed overlay with "GAME OVER" and restart instructions
+    GAME_OVER_OVERLAY.draw()  # Covers the whole window
     
-    # Create and draw final score
-    score_text = font.render(f"Final Score: {score}", True, NEON_GREEN)  # Green text
-    score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))  # Center of screen
-    screen.blit(score_text, score_rect)  # Draw centered score
-    
-    # Create and draw restart instructions
-    restart_text = font.render("Press R to Restart | ESC to Quit", True, WHITE)  # White text
-    restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))  # Center horizontally, slightly below center
-    screen.blit(restart_text, restart_rect)  # Draw centered instructions
+    # Draw cached final score
+    score_text, score_rect = _render_final_score(score)
+    score_text.draw(dstrect=score_rect)  # Draw centered score
 
 
 def main():
@@ -218,14 +397,22 @@ def main():
     # Create snake object
     snake = Snake()
     
-    # Create food object (pass snake body to avoid overlap)
-    food = Food(snake.body)
+    # Create food object (pass free cells to avoid overlap)
+    food = Food(snake.empty)
+    
+    # Post a STEP_EVENT every game tick (replaces busy-waiting with clock.tick)
+    pygame.time.set_timer(STEP_EVENT, 1000 // FPS)  # Milliseconds between ticks
     
     # Main game loop - runs until window is closed
     running = True  # Loop control variable
     while running:
-        # Handle all events (keyboard, mouse, window close, etc.)
-        for event in pygame.event.get():  # Get all events from event queue
+        step_due = False  # Set when the tick timer fires
+        
+        # Sleep until an event arrives, then handle it and anything else queued
+        for event in [pygame.event.wait()] + pygame.event.get():
+            if event.type == STEP_EVENT:  # Time to advance the game one tick
+                step_due = True
+            
             if event.type == pygame.QUIT:  # User clicked window close button
                 running = False  # Exit loop
                 break  # Exit event loop
@@ -236,15 +423,9 @@ def main():
                     break  # Exit event loop
                 
                 # Handle arrow key input (only when playing)
-                if game_state == PLAYING:  # Only process movement during gameplay
-                    if event.key == pygame.K_UP:  # Up arrow
-                        snake.change_direction([0, -1])  # Move up (y decreases)
-                    elif event.key == pygame.K_DOWN:  # Down arrow
-                        snake.change_direction([0, 1])  # Move down (y increases)
-                    elif event.key == pygame.K_LEFT:  # Left arrow
-                        snake.change_direction([-1, 0])  # Move left (x decreases)
-                    elif event.key == pygame.K_RIGHT:  # Right arrow
-                        snake.change_direction([1, 0])  # Move right (x increases)
+                new_direction = DIR_BY_KEY.get(event.key)  # None for non-arrow keys
+                if new_direction is not None and game_state == PLAYING:  # Only process movement during gameplay
+                    snake.change_direction(new_direction)
                 
                 # Handle restart on game over screen
                 if event.key == pygame.K_r and game_state == GAME_OVER:  # R key when game over
@@ -252,37 +433,38 @@ def main():
                     game_state = PLAYING  # Back to playing
                     score = 0  # Reset score
                     snake = Snake()  # Create new snake
-                    food = Food(snake.body)  # Create new food
+                    food = Food(snake.empty)  # Create new food
+        
+        # Only move and redraw on timer ticks (key presses are queued above)
+        if not running or not step_due:
+            continue
         
         # Update game logic (only when playing)
         if game_state == PLAYING:  # Only update during gameplay
-            # Move snake forward one grid cell
-            snake.update()  # Add new head in current direction
+            # Check if snake is about to eat food
+            ate_food = check_food_collision(snake, food)  # Next head cell is the food cell
+            
+            # Move snake forward one grid cell (tail stays put when growing)
+            snake.update(ate_food)
             
-            # Check if snake ate food
-            if check_food_collision(snake, food):  # Head on food cell
-                snake.grow()  # Snake grows (don't remove tail)
+            if ate_food:  # Snake ate the food
                 score += 10  # Increase score by 10
-                food = Food(snake.body)  # Create new food at random position
-            else:  # Didn't eat food
-                snake.shrink()  # Remove tail (keep length constant)
+                if snake.empty.cells:  # Free cells left for new food
+                    food = Food(snake.empty)  # Create new food at random position
+                else:  # Snake fills the whole grid - nothing left to eat
+                    game_state = GAME_OVER  # Game won, end the round
             
             # Check for collisions (walls or self)
             if snake.check_collision():  # Collision detected
                 game_state = GAME_OVER  # Change to game over state
         
-        # Draw everything on screen
-        screen.fill(BLACK)  # Clear screen with black background
+        # Draw everything on the GPU - the whole frame is redrawn each tick
+        renderer.clear()  # Start a new frame
+        GRID_BG.draw()  # Cached background + grid lines
         
-        # Draw subtle grid lines (optional visual aid)
-        for x in range(0, WINDOW_WIDTH, GRID_SIZE):  # Vertical lines
-            pygame.draw.line(screen, DARK_GRAY, (x, 0), (x, WINDOW_HEIGHT), 1)  # Thin dark gray line
-        for y in range(0, WINDOW_HEIGHT, GRID_SIZE):  # Horizontal lines
-            pygame.draw.line(screen, DARK_GRAY, (0, y), (WINDOW_WIDTH, y), 1)  # Thin dark gray line
-        
-        # Draw game elements
-        food.draw(screen)  # Draw food on screen
-        snake.draw(screen)  # Draw snake on screen
+        # Draw game elements as textured quads
+        for sprite, position in build_draw_list(snake, food):  # Food, head, then body
+            sprite.draw(dstrect=position)
         draw_score(score)  # Draw score in top-left
         
         # Draw game over overlay if needed
@@ -290,10 +472,7 @@ def main():
             draw_game_over(score)  # Draw game over screen
         
         # Update display - show everything we drew
-        pygame.display.update()  # Refresh the screen (required for changes to be visible)
-        
-        # Control frame rate - wait until next frame should be displayed
-        clock.tick(FPS)  # Limit to FPS frames per second
+        renderer.present()  # Swap the finished frame onto the window
     
     # Cleanup - game loop has ended
     pygame.quit()  # Uninitialize pygame modules